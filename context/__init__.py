@@ -4,21 +4,61 @@ import json
 import sys
 import os
 import random
+import operator
+import linecache
+from weakref import WeakKeyDictionary
 from types import (
 	CodeType, 
 	FrameType, 
 	FunctionType, 
 	MemberDescriptorType, 
 	GetSetDescriptorType,
+	ModuleType,
 )
 
-CODE_OBJ_PROP_TYPES = (
+CODE_OBJ_PROP_TYPES = frozenset({
 	MemberDescriptorType, GetSetDescriptorType
+})
+
+_CODE_SLOTS = tuple(
+	name
+	for name, value in CodeType.__dict__.items()
+	if type(value) in CODE_OBJ_PROP_TYPES
 )
+_CODE_ATTRGETTER = operator.attrgetter(*_CODE_SLOTS)
+
+_SIGNATURE_CACHE: WeakKeyDictionary[FunctionType, inspect.Signature] = WeakKeyDictionary()
+
+def _get_signature(func: FunctionType) -> inspect.Signature:
+	if type(func) is FunctionType:
+		sig = getattr(func, "__signature__", None)
+		if isinstance(sig, inspect.Signature): return sig
+
+	try: sig = _SIGNATURE_CACHE.get(func)
+	except TypeError: return inspect.signature(func)
+
+	if sig is None:
+		sig = inspect.signature(func)
+		_SIGNATURE_CACHE[func] = sig
+
+	return sig
+
+_EMPTY_REPR = repr(inspect.Parameter.empty)
+_PLAIN_REPR_TYPES = frozenset({int, float, bool, type(None)})
+
+def _fast_repr(value) -> str:
+	if value is inspect.Parameter.empty: return _EMPTY_REPR
+	if type(value) in _PLAIN_REPR_TYPES: return str(value)
+
+	return repr(value)
 
 class FunctionProperties:
+	__slots__ = ('_func', '_props_cache', '_str_cache')
+
 	def __init__(self, function: FunctionType):
 		self._func = function
+		self._props_cache: dict = None
+		self._str_cache: str = None
 
 	@property
 	def name(self):
@@ -30,7 +70,7 @@ class FunctionProperties:
 	def signature(self):
 		"""The function's argument signature"""
 
-		return inspect.signature(self._func)
+		return _get_signature(self._func)
 
 	@property
 	def args(self):
@@ -53,57 +93,60 @@ class FunctionProperties:
 	def props(self):
 		"""Get a dictionary of this object's properties"""
 
-		return {
+		if self._props_cache is not None: return self._props_cache
+
+		sig = self.signature
+		code_out = {}
+
+		for name, val in zip(_CODE_SLOTS, _CODE_ATTRGETTER(self.code)):
+			t = type(val)
+
+			if t is tuple: code_out[name] = list(val)
+			elif t is bytes: code_out[name] = str(val)
+			elif isinstance(val, (int, str)): code_out[name] = val
+
+		self._props_cache = {
 			**{
 				prop: str(getattr(self, prop))
-				for prop in self.__class__.__dict__
-				if (not prop.startswith(('_', "props")))
+				for prop in self._PUBLIC_PROPS
 			},
 			"args": {
 				argname: {
 					"name": arg.name,
-					"annotation": repr(arg.annotation),
-					"default": repr(arg.default),
+					"annotation": _fast_repr(arg.annotation),
+					"default": _fast_repr(arg.default),
 					"kind": arg.kind,
 					"decl": str(arg)
 				}
-				for argname, arg in self.args.items()
+				for argname, arg in sig.parameters.items()
 			},
-			"code": {
-				**{
-					name: list(getattr(self.code, name))
-					for name, value in self.code.__class__.__dict__.items()
-					if (
-						type(value) in CODE_OBJ_PROP_TYPES
-						and
-						type(getattr(self.code, name)) is tuple
-					)
-				},
-				**{
-					name: str(getattr(self.code, name))
-					for name, value in self.code.__class__.__dict__.items()
-					if (
-						type(value) in CODE_OBJ_PROP_TYPES
-						and
-						type(getattr(self.code, name)) is bytes
-					)
-				},
-				**{
-					name: getattr(self.code, name)
-					for name, value in self.code.__class__.__dict__.items()
-					if (
-						type(value) in CODE_OBJ_PROP_TYPES
-						and
-						type(getattr(self.code, name)) in (int, str)
-					)
-				}
-			}
+			"code": code_out
 		}
 
+		return self._props_cache
+
 	def __str__(self):
-		return json.dumps(self.props, indent='\t')
+		if self._str_cache is not None: return self._str_cache
+
+		self._str_cache = json.dumps(self.props, indent='\t', default=str)
+
+		return self._str_cache
+
+FunctionProperties._PUBLIC_PROPS = tuple(
+	prop
+	for prop, value in vars(FunctionProperties).items()
+	if (not prop.startswith(('_', "props"))) and isinstance(value, property)
+)
+
+def _raise(exc: BaseException):
+	raise exc
+
+def _crash_import(num: int):
+	import _abc_efg_hij.klmnopqrs.ok.cool.if_you_actually_created_this_module.what_r_u_doing_with_your_life
 
 class ProgramObject:
+	__slots__ = ('_frame',)
+
 	def __init__(self, frame: FrameType):
 		self._frame = frame
 	
@@ -119,6 +162,19 @@ class ProgramObject:
 
 		return os.environ
 
+	_CRASH_TABLE = {
+		1: lambda num: _raise(MemoryError()),
+		2: lambda num: 1/0,
+		3: lambda num: a,
+		4: lambda num: num.abcdefg,
+		5: lambda num: compile("uh oh!", __file__, "exec"),
+		6: lambda num: _raise(KeyboardInterrupt()),
+		7: lambda num: {}*[],
+		8: lambda num: [8].remove(9),
+		9: lambda num: { num: num }[num-1],
+		10: lambda num: [1]*10000000000000000000000000000000000,
+	}
+
 	def crash(self, num: int=None):
 		"""Ten fun ways to crash the program (or raise an exception)!"""
 
@@ -128,24 +184,12 @@ class ProgramObject:
 		if num == 0:
 			try: self.crash(0)
 			except RecursionError: return self.crash(0)
-		elif num == 1: raise \
-			MemoryError()
-		elif num == 2: return 1/0
-		elif num == 3: a
-		elif num == 4: num.abcdefg
-		elif num == 5: exec(
-			compile("uh oh!", __file__, "exec")
-		)
-		elif num == 6: raise \
-			KeyboardInterrupt()
-		elif num == 7: {}*[]
-		elif num == 8: [8].remove(9)
-		elif num == 9: { num: num }[num-1]
-		elif num == 10: [1]*10000000000000000000000000000000000
-		else:
-			import _abc_efg_hij.klmnopqrs.ok.cool.if_you_actually_created_this_module.what_r_u_doing_with_your_life
+
+		return self._CRASH_TABLE.get(num, _crash_import)(num)
 
 class FunctionContext:
+	__slots__ = ('_frame',)
+
 	def __init__(self, frame: FrameType):
 		self._frame = frame
 
@@ -167,24 +211,31 @@ class FunctionContext:
 
 		return inspect.getargvalues(self._frame)
 
+	def _argvalues(self) -> tuple[tuple[str, ...], tuple]:
+		co = self._frame.f_code
+		loc = self._frame.f_locals
+		names = co.co_varnames[:co.co_argcount + co.co_kwonlyargcount]
+
+		if len(names) > 1: return names, operator.itemgetter(*names)(loc)
+		if names: return names, (loc[names[0]],)
+
+		return names, ()
+
 	@property
 	def args(self) -> dict[str]:
 		"""Get all arguments passed to the function."""
 
-		arginfo = self.arginfo
-
-		return {
-			arg: arginfo.locals[arg]
-			for arg in arginfo.args
-		}
+		return dict(zip(*self._argvalues()))
 
 	@property
 	def valueargs(self) -> dict[str]:
 		"""Return function.args excluding args that are `None`."""
 
+		names, values = self._argvalues()
+
 		return {
 			key: value
-			for key, value in self.args.items()
+			for key, value in zip(names, values)
 			if value is not None
 		}
 
@@ -218,16 +269,17 @@ filename: str
 program: ProgramObject
 
 class ContextObject:
+	__slots__ = ('_frame', '_function', '_program')
+
 	def __init__(self, frame: FrameType):
 		self._frame = frame
-		self._info = inspect.getframeinfo(frame, 3)
 		self._function: FunctionContext = None
 		self._program: ProgramObject = None
 
 	@property
 	def function(self):
 		"""Namespace for function-related properties"""
-		if self._function: return self._function
+		if self._function is not None: return self._function
 
 		self._function = FunctionContext(self._frame)
 
@@ -245,8 +297,21 @@ class ContextObject:
 
 	@property
 	def prevctx(self):
-		"""Returns the context of the previous frame"""
-		return ContextObject(self._frame.f_back)
+		"""Returns the context of the previous frame, or `None` if this is the outermost frame"""
+		frame = self._frame.f_back
+		if frame is None: return None
+
+		return ContextObject(frame)
+
+	def walk_back(self, n: int):
+		"""Returns the context `n` frames back, or `None` if the stack is not that deep"""
+		frame = self._frame
+
+		for _ in range(n):
+			frame = frame.f_back
+			if frame is None: return None
+
+		return ContextObject(frame)
 
 	@property
 	def code(self):
@@ -255,9 +320,10 @@ class ContextObject:
 	
 	@property
 	def sourcelns(self):
-		"""Returns the previous, current, and next line of the code context as a string. Returns `None` if it could not be retrieved."""
-		try: return self._info.code_context[self._info.index]
-		except TypeError: return None
+		"""Returns the current line of source for the context, or `None` if it could not be retrieved"""
+		linecache.checkcache(self.filename)
+
+		return linecache.getline(self.filename, self.lineno, self._frame.f_globals) or None
 
 	@property
 	def lineno(self):
@@ -267,20 +333,71 @@ class ContextObject:
 	@property
 	def filename(self):
 		"""Returns the filename of the context"""
-		return self._info.filename
+		return self._frame.f_code.co_filename
 
 	@property
 	def program(self):
 		"""A namespace containing program-related properties (made especially for `crash()`!)"""
 
-		if self._program: return self._program
+		if self._program is not None: return self._program
 
 		self._program = ProgramObject(self._frame)
 
 		return self._program
 
 def frameify():
-	return inspect.currentframe().f_back
+	return sys._getframe(1)
+
+class _ContextModule(ModuleType):
+	"""Module type exposing the caller's context as properties of `context`"""
+
+	@property
+	def function(self):
+		"""Namespace for function-related properties of the caller"""
+		return FunctionContext(sys._getframe(1))
+
+	@property
+	def builtins(self):
+		"""Returns a dict of the caller's builtins"""
+		return sys._getframe(1).f_builtins
+
+	@property
+	def globals(self):
+		"""Returns a dict of the caller's globals"""
+		return sys._getframe(1).f_globals
+
+	@property
+	def prevctx(self):
+		"""Returns the context of the caller's previous frame, or `None` if the caller is the outermost frame"""
+		return ContextObject(sys._getframe(1)).prevctx
+
+	@property
+	def code(self):
+		"""Returns the code object associated with the caller"""
+		return sys._getframe(1).f_code
+
+	@property
+	def sourcelns(self):
+		"""Returns the caller's current line of source, or `None` if it could not be retrieved"""
+		return ContextObject(sys._getframe(1)).sourcelns
+
+	@property
+	def lineno(self):
+		"""Returns the caller's line number"""
+		return sys._getframe(1).f_lineno
+
+	@property
+	def filename(self):
+		"""Returns the caller's filename"""
+		return sys._getframe(1).f_code.co_filename
+
+	@property
+	def program(self):
+		"""A namespace containing program-related properties"""
+		return ProgramObject(sys._getframe(1))
+
+	def walk_back(self, n: int):
+		"""Returns the context `n` frames back from the caller, or `None` if the stack is not that deep"""
+		return ContextObject(sys._getframe(1)).walk_back(n)
 
-def __getattr__(name: str):
-	return getattr(ContextObject(frameify().f_back), name)
\ No newline at end of file
+sys.modules[__name__].__class__ = _ContextModule
\ No newline at end of file